@@ -1,8 +1,14 @@
+import functools
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional
 
+import openpyxl.utils
 import yaml
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
+
+# Use the libyaml based loader when PyYAML has been built with libyaml, as it is much faster than the pure Python loader
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class TableConfig(BaseModel):
@@ -55,6 +61,49 @@ class TableConfig(BaseModel):
     columns_with_merged_rows: Optional[str | List[str]] = None
     forward_fill_values: bool = True
 
+    @field_validator("header_rows")
+    @classmethod
+    def _check_header_rows_are_consecutive(
+        cls, header_rows: int | List[int]
+    ) -> int | List[int]:
+        """Checks that a list of header rows has multiple rows that are sorted in ascending order and adjacent."""
+        if isinstance(header_rows, list) and not (
+            len(header_rows) > 1
+            and all(
+                next_row == row + 1
+                for row, next_row in zip(header_rows, header_rows[1:])
+            )
+        ):
+            raise ValueError(
+                "header_rows must be an int or a list of two or more consecutive row "
+                "numbers in ascending order"
+            )
+        return header_rows
+
+    @property
+    def first_header_row(self) -> int:
+        """The first row of the table header."""
+        if isinstance(self.header_rows, int):
+            return self.header_rows
+        return self.header_rows[0]
+
+    @property
+    def last_header_row(self) -> int:
+        """The last row of the table header, i.e. the row before the first row of table data."""
+        if isinstance(self.header_rows, int):
+            return self.header_rows
+        return self.header_rows[-1]
+
+    @property
+    def first_column_index(self) -> int:
+        """The 1-based index of the first column of the table, e.g. 2 for column 'B'."""
+        return openpyxl.utils.column_index_from_string(self.column_range.split(":")[0])
+
+    @property
+    def last_column_index(self) -> int:
+        """The 1-based index of the last column of the table."""
+        return openpyxl.utils.column_index_from_string(self.column_range.split(":")[1])
+
 
 def load_yaml(path: Path) -> dict[str, TableConfig]:
     """Loads the YAML file specified by the path returning a dict of `TableConfig`s.
@@ -117,11 +166,22 @@ def load_yaml(path: Path) -> dict[str, TableConfig]:
         path: pathlib Path instance specifying the location of the YAML file.
 
     """
-    with open(path, "r") as f:
-        config = yaml.safe_load(f)
-        f.close()
+    config = _read_yaml(str(path), os.stat(path).st_mtime_ns)
     if config is not None:
         tables = {name: TableConfig(name=name, **config[name]) for name in config}
     else:
         tables = {}
     return tables
+
+
+@functools.lru_cache(maxsize=512)
+def _read_yaml(path: str, modified_time: int) -> Any:
+    """Parses a YAML file, caching the result by the file path and modification time.
+
+    The packaged config files are parsed each time a `Parser` is created, so caching means each file is only parsed
+    once unless it is modified. `TableConfig` instances are mutable, so `load_yaml` creates new instances from the
+    cached result on each call. Each modification of a file adds a new entry, so the cache is bounded, with room for
+    the config files of several workbook versions.
+    """
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_SafeLoader)
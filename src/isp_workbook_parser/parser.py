@@ -1,17 +1,65 @@
-import glob
+import functools
+import io
 import os
+import re
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
-import numpy as np
 import openpyxl
-import openpyxl.utils
 import pandas as pd
 from thefuzz import process
 
 from .config_model import TableConfig, load_yaml
-from .read_table import _find_data_column_index, read_table
+from .read_table import read_sheet_data, read_table
 from .sanitisers import _values_casting_and_sanitisation
+from .workbook_metadata import read_column_values, read_sheet_names
+
+_DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / Path("isp_table_configs")
+# The strings pandas reads as NA by default (see the na_values parameter of pandas.read_excel)
+_NA_STRINGS = frozenset(
+    [
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    ]
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _list_config_versions(config_path: Path) -> frozenset[str]:
+    """Lists the workbook versions in the packaged config directory, which has a subdirectory for each version.
+
+    The packaged config directory doesn't change while the package is installed, so it is only listed once.
+    """
+    return frozenset(os.listdir(config_path))
+
+
+def _is_empty_cell_value(value: Any) -> bool:
+    """Checks if a raw cell value would be read as NA by pandas.
+
+    The raw sheet data is read without NA filtering, so this treats the strings pandas reads as NA by default (e.g.
+    "", "N/A" and "#N/A") and missing values (e.g. error cells) as empty.
+    """
+    return pd.isna(value) or (isinstance(value, str) and value in _NA_STRINGS)
 
 
 class Parser:
@@ -44,19 +92,37 @@ class Parser:
     >>> workbook.save_tables('example_output') # doctest: +SKIP
     """
 
+    _notes_sub_strings = ["Notes:", "Note:", "Source:", "Sources:"]
+    _notes_pattern = re.compile(
+        "|".join(re.escape(sub_string) for sub_string in _notes_sub_strings)
+    )
+
     def __init__(
         self, file_path: str | Path, user_config_directory_path: str | Path = None
     ) -> None:
         self.file_path = self._make_path_object(file_path)
-        self.file = pd.ExcelFile(self.file_path)
-        self.openpyxl_file = openpyxl.load_workbook(self.file_path)
-        self.workbook_version = self._get_version()
-        self.default_config_path = Path(__file__).parent.parent / Path(
-            "isp_table_configs"
-        )
+        # Read the workbook from disk once and share the bytes between the metadata reader, pandas and openpyxl
+        self._workbook_bytes = self.file_path.read_bytes()
+        with zipfile.ZipFile(io.BytesIO(self._workbook_bytes)) as archive:
+            self._sheet_names = read_sheet_names(archive)
+            self.workbook_version = self._get_version(archive)
+        self.default_config_path = _DEFAULT_CONFIG_PATH
         self.config_path = self._determine_config_path(user_config_directory_path)
         self.table_configs = self._load_config()
         self.table_names_by_sheet = self._get_table_names_by_sheet()
+        self._sheet_data = {}
+        self._percentage_cells = {}
+        self._sheet_dims = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Returns the instance state without the opened workbooks, which can't be pickled.
+
+        The workbooks are opened again from the workbook bytes the first time they are needed after unpickling.
+        """
+        state = self.__dict__.copy()
+        state.pop("file", None)
+        state.pop("openpyxl_file", None)
+        return state
 
     @staticmethod
     def _make_path_object(path: str | Path) -> Path:
@@ -65,18 +131,36 @@ class Parser:
             path = Path(path)
         return path
 
-    def _get_version(self) -> str:
+    @functools.cached_property
+    def openpyxl_file(self) -> openpyxl.Workbook:
+        """The workbook loaded with openpyxl, which is only loaded the first time it is needed.
+
+        The workbook is loaded in read only mode, which streams worksheets on demand rather than loading every cell
+        into memory. data_only is not set, as formula cells need to be distinguishable from values when
+        post-processing percentages.
+        """
+        return openpyxl.load_workbook(
+            io.BytesIO(self._workbook_bytes), read_only=True, keep_links=False
+        )
+
+    @functools.cached_property
+    def file(self) -> pd.ExcelFile:
+        """The workbook opened as a `pd.ExcelFile`, which is only opened the first time a table is read."""
+        return pd.ExcelFile(io.BytesIO(self._workbook_bytes))
+
+    def _get_version(self, archive: zipfile.ZipFile) -> str:
         """Extract the version number of the workbook from the sheet 'Change Log'.
 
-        In the change log the version number is last value in the 'B' column. This method iterates through the values
-        in the 'B' and returns the last value in the column.
+        In the change log the version number is last value in the 'B' column. This method reads the values in the
+        'B' column directly from the sheet's XML, so the workbook doesn't need to be loaded, and returns the last value
+        in the column.
         """
-        sheet = self.openpyxl_file["Change Log"]
-        last_value = None
-        for cell in sheet["B"]:
-            if cell.value is not None:
-                last_value = cell.value
-        version = float(last_value)
+        values = read_column_values(archive, "Change Log", "B")
+        if not values:
+            raise ValueError(
+                "The workbook version could not be read, as the 'B' column of the sheet 'Change Log' is empty."
+            )
+        version = float(values[-1])
         return str(version)
 
     def _determine_config_path(
@@ -99,7 +183,7 @@ class Parser:
 
     def _check_version_is_supported(self, config_path) -> None:
         """Check the default config directory contains a subdirectory that matches the workbook version number."""
-        versions = os.listdir(config_path)
+        versions = _list_config_versions(config_path)
         if self.workbook_version not in versions:
             raise ValueError(
                 f"The workbook version {self.workbook_version} is not supported."
@@ -110,8 +194,13 @@ class Parser:
         and table names as second level keys. For robustness across workbook versions, the config sheet name
         is matched with a workbook sheet name in case-agnostic manner.
         """
-        pattern = os.path.join(self.config_path, "*.yaml")
-        config_files = glob.glob(pattern)
+        with os.scandir(self.config_path) as entries:
+            # hidden files are skipped, as they were when matching "*.yaml" with glob
+            config_files = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".yaml") and not entry.name.startswith(".")
+            ]
         configs = {}
         for file in config_files:
             config_dict = load_yaml(Path(file))
@@ -120,7 +209,7 @@ class Parser:
                 config_sheet_name_lowercase = config.sheet_name.lower()
                 sheet_names = [
                     sheet_name
-                    for sheet_name in self.file.sheet_names
+                    for sheet_name in self._sheet_names
                     if sheet_name.lower() == config_sheet_name_lowercase
                 ]
                 if len(sheet_names) > 1:
@@ -138,70 +227,118 @@ class Parser:
         return configs
 
     def _get_table_names_by_sheet(self):
-        table_names_by_sheet = {}
+        table_names_by_sheet = defaultdict(list)
         for table_name, config in self.table_configs.items():
-            if config.sheet_name not in table_names_by_sheet:
-                table_names_by_sheet[config.sheet_name] = []
             table_names_by_sheet[config.sheet_name].append(table_name)
-        sorted_table_names_by_sheet = dict(sorted(table_names_by_sheet.items()))
-        for sheet_name, tables in sorted_table_names_by_sheet.items():
-            sorted_table_names_by_sheet[sheet_name] = sorted(tables)
-        return sorted_table_names_by_sheet
+        return {
+            sheet_name: sorted(table_names_by_sheet[sheet_name])
+            for sheet_name in sorted(table_names_by_sheet)
+        }
 
-    def _check_data_ends_where_expected(
-        self, tab: str, end_row: int, range: str, name: str
-    ) -> None:
+    def _get_sheet_data(self, sheet_name: str) -> pd.DataFrame:
+        """Returns the raw data for a sheet, reading the sheet from the workbook only the first time it is requested.
+
+        Many tables are often defined on the same sheet, so caching the raw sheet data means that each sheet is only
+        parsed once, rather than once for every table on the sheet.
+        """
+        if sheet_name not in self._sheet_data:
+            self._sheet_data[sheet_name] = read_sheet_data(self.file, sheet_name)
+        return self._sheet_data[sheet_name]
+
+    def _get_percentage_cells(self, sheet_name: str) -> set[tuple[int, int]]:
+        """Returns the (row, column) coordinates of numeric cells with percentage formatting on a worksheet.
+
+        Worksheets in read only mode are streamed from the start of the sheet for every read, so each worksheet is
+        streamed once, the first time it is requested, and the coordinates of the percentage cells are cached.
+        """
+        if sheet_name not in self._percentage_cells:
+            percentage_cells = set()
+            for row in self.openpyxl_file[sheet_name].iter_rows():
+                for cell in row:
+                    if (
+                        isinstance(cell.value, (int, float))
+                        and "%" in cell.number_format
+                    ):
+                        percentage_cells.add((cell.row, cell.column))
+            self._percentage_cells[sheet_name] = percentage_cells
+        return self._percentage_cells[sheet_name]
+
+    def _get_sheet_dims(self, sheet_name: str) -> tuple[int, int]:
+        """Returns the maximum row and maximum column of a worksheet.
+
+        In read only mode the dimensions are taken from the dimension record stored in the worksheet. If a worksheet
+        doesn't have a dimension record, the dimensions are calculated by streaming the worksheet, so the dimensions
+        are cached to ensure this only happens once per sheet.
+        """
+        if sheet_name not in self._sheet_dims:
+            sheet = self.openpyxl_file[sheet_name]
+            if sheet.max_row is None or sheet.max_column is None:
+                sheet.calculate_dimension(force=True)
+            self._sheet_dims[sheet_name] = (sheet.max_row, sheet.max_column)
+        return self._sheet_dims[sheet_name]
+
+    def _get_cell_value(self, sheet_name: str, row: int, column: int) -> Any:
+        """Returns the value of a single cell from the cached sheet data, or an empty string if the cell is outside
+        the sheet data."""
+        sheet_data = self._get_sheet_data(sheet_name)
+        if 1 <= row <= sheet_data.shape[0] and 1 <= column <= sheet_data.shape[1]:
+            return sheet_data.iat[row - 1, column - 1]
+        return ""
+
+    def _get_column_values(
+        self, sheet_name: str, column: int, min_row: int, max_row: int
+    ) -> list:
+        """Returns the values of the cells in a column from min_row to max_row (inclusive).
+
+        The values are sliced from the cached sheet data. Cells outside the sheet data, which has trailing empty rows
+        and columns trimmed, are returned as empty strings.
+        """
+        sheet_data = self._get_sheet_data(sheet_name)
+        n_rows = max_row - min_row + 1
+        if not 1 <= column <= sheet_data.shape[1]:
+            return [""] * n_rows
+        values = sheet_data.iloc[min_row - 1 : max_row, column - 1].tolist()
+        return values + [""] * (n_rows - len(values))
+
+    def _check_data_ends_where_expected(self, table_config) -> None:
         """Check that the cell after the last row of the table in the second column is blank.
 
         While there are often notes on the data in the first cell after the first column ends, the first cell after the
         second column ends appears to be always blank. Therefore, checking that this cell is blank can be used to verify
         that the config has not specified a table end row that is before the actual last row of the table.
         """
-        first_column = range.split(":")[0]
-        first_col_index = openpyxl.utils.column_index_from_string(first_column)
-        second_col_index = first_col_index + 1
+        second_col_index = table_config.first_column_index + 1
         # We check that value in the second column is blank because sometime the row after the first column will
         # contain notes on the data.
-        value_in_second_column_after_last_row = (
-            self.openpyxl_file[tab].cell(row=end_row + 1, column=second_col_index).value
+        value_in_second_column_after_last_row = self._get_cell_value(
+            table_config.sheet_name, table_config.end_row + 1, second_col_index
         )
         if (
             value_in_second_column_after_last_row is not None
             and value_in_second_column_after_last_row not in ["", " ", "\u00a0"]
         ):
-            error_message = f"There is data in the row after the defined table end for table {name}."
+            error_message = f"There is data in the row after the defined table end for table {table_config.name}."
             raise TableConfigError(error_message)
 
-    def _check_no_data_above_first_header_row(
-        self, tab: str, header_rows: int, range: str, name: str
-    ) -> None:
+    def _check_no_data_above_first_header_row(self, table_config) -> None:
         """Check that the cell before the first header row of the table in the second column is blank.
 
         While there are often notes on the data in the first cell above the first column, the first cell above the
         second column appears to be always blank. Therefore, checking that this cell is blank can be used to verify
         that the config has not specified a table header row that is after the first header row of the table.
         """
-        first_column = range.split(":")[0]
-        first_col_index = openpyxl.utils.column_index_from_string(first_column)
-        second_col_index = first_col_index + 1
-
-        if isinstance(header_rows, int):
-            first_header_row = header_rows
-        else:
-            first_header_row = header_rows[0]
+        second_col_index = table_config.first_column_index + 1
 
         # We check that value in the second column is blank because sometime the row after the first column will
         # contain notes on the data.
-        value_in_second_column_after_last_row = (
-            self.openpyxl_file[tab]
-            .cell(row=first_header_row - 1, column=second_col_index)
-            .value
+        value_in_second_column_after_last_row = self._get_cell_value(
+            table_config.sheet_name, table_config.first_header_row - 1, second_col_index
         )
         if (
             value_in_second_column_after_last_row is not None
             and value_in_second_column_after_last_row not in ["", " ", "\u00a0"]
         ):
-            error_message = f"There is data or a header above the first header row for table {name}."
+            error_message = f"There is data or a header above the first header row for table {table_config.name}."
             raise TableConfigError(error_message)
 
     @staticmethod
@@ -213,15 +350,15 @@ class Parser:
         table and inside a following table or set of notes. Therefore, the presence of NA values in the first column
         can be used to check if the end row is incorrectly specified in the config.
         """
-        if data[data.columns[0]].isna().any():
+        if data.iloc[:, 0].hasnans:
             error_message = (
                 f"The first column of the table {name} contains na values indicating the table end "
                 f"row is incorrectly specified."
             )
             raise TableConfigError(error_message)
 
-    @staticmethod
-    def _check_for_over_run_into_notes(data: pd.DataFrame, name: str) -> None:
+    @classmethod
+    def _check_for_over_run_into_notes(cls, data: pd.DataFrame, name: str) -> None:
         """Check that the values in the first column don't contain substrings: "Notes:", "Note:", "Source:", "Sources:".
 
         Often the first cell after the end of the first column contains notes on the table, which appear to always
@@ -230,11 +367,27 @@ class Parser:
         are present in any of the values in the first column is helpful in detecting if the end row is incorrectly
         specified.
         """
-        notes_sub_strings = ["Notes:", "Note:", "Source:", "Sources:"]
-        for sub_string in notes_sub_strings:
-            if data[data.columns[0]].astype(str).str.contains(sub_string).any():
-                error_message = f"The first column of the table {name} contains the sub string '{sub_string}'."
-                raise TableConfigError(error_message)
+        first_column = data.iloc[:, 0]
+        # Only string values can contain the substrings, so columns without strings (e.g. numeric ID columns) are
+        # skipped, and string columns are scanned directly rather than being copied with astype(str).
+        if pd.api.types.infer_dtype(first_column, skipna=True) not in [
+            "string",
+            "mixed",
+            "mixed-integer",
+        ]:
+            return
+        # Every substring contains a colon, so a cheap literal scan for colons rules out most values before the
+        # regex scan for the substrings. Then only the matching values are checked to find which substring to report.
+        first_column = first_column[
+            first_column.str.contains(":", regex=False, na=False)
+        ]
+        has_notes = first_column.str.contains(cls._notes_pattern)
+        if has_notes.any():
+            values_with_notes = first_column[has_notes]
+            for sub_string in cls._notes_sub_strings:
+                if values_with_notes.str.contains(sub_string, regex=False).any():
+                    error_message = f"The first column of the table {name} contains the sub string '{sub_string}'."
+                    raise TableConfigError(error_message)
 
     @staticmethod
     def _check_last_column_isnt_empty(data: pd.DataFrame, name: str) -> None:
@@ -244,7 +397,7 @@ class Parser:
         table then empty columns of data could be read into the table. Checking if the last column in the table is
         empty helps detect if the config is incorrect.
         """
-        if data[data.columns[-1]].isna().all():
+        if data.iloc[:, -1].first_valid_index() is None:
             error_message = f"The last column of the table {name} is empty."
             raise TableConfigError(error_message)
 
@@ -262,7 +415,7 @@ class Parser:
             raise TableConfigError(error_message)
 
     def _check_for_missed_column_on_right_hand_side_of_table(
-        self, sheet_name: str, start_row: int, end_row: int, range: str, name: str
+        self, table_config
     ) -> None:
         """Checks if there is data in the column adjacent to last column specified in the config.
 
@@ -270,135 +423,79 @@ class Parser:
         there is data in the adjacent column can help detect when the column range in the config has been incorrectly
         specified.
         """
-        last_column = range.split(":")[1]
-        last_col_index = openpyxl.utils.column_index_from_string(last_column)
-        column_next_to_last_column = openpyxl.utils.get_column_letter(
-            last_col_index + 1
+        column_next_to_last_column = table_config.last_column_index + 1
+        values = self._get_column_values(
+            table_config.sheet_name,
+            column_next_to_last_column,
+            table_config.last_header_row + 1,
+            table_config.end_row,
         )
-        column_next_to_last_column = (
-            column_next_to_last_column + ":" + column_next_to_last_column
+        # explicit exceptions for messy data, non breaking spaces and empty strings
+        range_error = any(
+            not _is_empty_cell_value(value) and value not in ["\u00a0", "`"]
+            for value in values
         )
-        range_error = False
-        try:
-            data = pd.read_excel(
-                self.file,
-                sheet_name=sheet_name,
-                header=start_row - 1,
-                usecols=column_next_to_last_column,
-                nrows=(end_row - start_row),
-            )
-            data = data[~data.isin(["`"])]  # explicit exceptions for messy data
-            # replace non breaking space with empty string
-            data = data.replace("\xa0", "")
-            # replace empty strings with np.nan
-            data = data.replace("", np.nan)
-            if not data[data.columns[0]].isna().all():
-                range_error = True
-        except pd.errors.ParserError:
-            range_error = False
 
         if range_error:
-            error_message = f"There is data in the column adjacent to the last column in the table {name}."
+            error_message = f"There is data in the column adjacent to the last column in the table {table_config.name}."
             raise TableConfigError(error_message)
 
-    def _check_for_missed_column_on_left_hand_side_of_table(
-        self, sheet_name: str, start_row: int, end_row: int, range: str, name: str
-    ) -> None:
+    def _check_for_missed_column_on_left_hand_side_of_table(self, table_config) -> None:
         """Checks if there is data in the column adjacent to first column specified in the config.
 
         It appears that the column adjacent to the first column in a table is always blank. Therefore, checking if
         there is data in the adjacent column can help detect when the column range in the config has been incorrectly
         specified.
         """
-        first_column = range.split(":")[0]
-        first_col_index = openpyxl.utils.column_index_from_string(first_column)
-        column_next_to_first_column = openpyxl.utils.get_column_letter(
-            first_col_index - 1
-        )
-        column_next_to_first_column = (
-            column_next_to_first_column + ":" + column_next_to_first_column
+        column_next_to_first_column = table_config.first_column_index - 1
+        header, *values = self._get_column_values(
+            table_config.sheet_name,
+            column_next_to_first_column,
+            table_config.last_header_row,
+            table_config.end_row,
         )
-        range_error = False
-        try:
-            data = pd.read_excel(
-                self.file,
-                sheet_name=sheet_name,
-                header=start_row - 1,
-                usecols=column_next_to_first_column,
-                nrows=(end_row - start_row),
-            )
-            if data[data.columns[0]].isna().all():
-                range_error = False
-            elif "DO NOT DELETE THIS COLUMN" in data.columns[0] or first_column == "B":
-                range_error = False
-            else:
-                range_error = True
-        except pd.errors.ParserError:
+        if all(_is_empty_cell_value(value) for value in values):
             range_error = False
+        # column A, next to tables starting in column B, is allowed to contain data
+        elif (
+            "DO NOT DELETE THIS COLUMN" in str(header)
+            or table_config.first_column_index == 2
+        ):
+            range_error = False
+        else:
+            range_error = True
 
         if range_error:
-            error_message = f"There is data in the column adjacent to the first column in the table {name}."
+            error_message = f"There is data in the column adjacent to the first column in the table {table_config.name}."
             raise TableConfigError(error_message)
 
     def _check_if_header_row_and_end_row_are_on_sheet(self, table_config) -> None:
         """Checks if first row of header and end_row are within the sheet."""
-        if isinstance(table_config.header_rows, int):
-            first_header_row = table_config.header_rows
-        else:
-            first_header_row = table_config.header_rows[0]
+        max_row, _ = self._get_sheet_dims(table_config.sheet_name)
 
-        if first_header_row > self.openpyxl_file[table_config.sheet_name].max_row:
+        if table_config.first_header_row > max_row:
             error_message = f"The first header row for table {table_config.name} is not within the excel sheet."
             raise TableConfigError(error_message)
-        if table_config.end_row > self.openpyxl_file[table_config.sheet_name].max_row:
+        if table_config.end_row > max_row:
             error_message = f"The end_row for table {table_config.name} is not within the excel sheet."
             raise TableConfigError(error_message)
 
     def _check_if_start_and_end_column_are_on_sheet(self, table_config) -> None:
         """Checks if first column and last column in config are within the sheet."""
-        first_column = table_config.column_range.split(":")[0]
-        first_col_index = openpyxl.utils.column_index_from_string(first_column)
-        if first_col_index > self.openpyxl_file[table_config.sheet_name].max_column:
+        _, max_column = self._get_sheet_dims(table_config.sheet_name)
+        if table_config.first_column_index > max_column:
             error_message = f"The first column for table {table_config.name} is not within the excel sheet."
             raise TableConfigError(error_message)
 
-        last_column = table_config.column_range.split(":")[1]
-        last_col_index = openpyxl.utils.column_index_from_string(last_column)
-        if last_col_index > self.openpyxl_file[table_config.sheet_name].max_column:
+        if table_config.last_column_index > max_column:
             error_message = f"The last column for table {table_config.name} is not within the excel sheet."
             raise TableConfigError(error_message)
 
     def _check_table(self, data, table_config) -> None:
-        if isinstance(table_config.header_rows, list):
-            start_row = table_config.header_rows[-1]
-        else:
-            start_row = table_config.header_rows
-        self._check_no_data_above_first_header_row(
-            table_config.sheet_name,
-            table_config.header_rows,
-            table_config.column_range,
-            table_config.name,
-        )
-        self._check_data_ends_where_expected(
-            table_config.sheet_name,
-            table_config.end_row,
-            table_config.column_range,
-            table_config.name,
-        )
-        self._check_for_missed_column_on_right_hand_side_of_table(
-            table_config.sheet_name,
-            start_row,
-            table_config.end_row,
-            table_config.column_range,
-            table_config.name,
-        )
-        self._check_for_missed_column_on_left_hand_side_of_table(
-            table_config.sheet_name,
-            start_row,
-            table_config.end_row,
-            table_config.column_range,
-            table_config.name,
-        )
+        self._check_no_data_above_first_header_row(table_config)
+        self._check_data_ends_where_expected(table_config)
+        self._check_for_missed_column_on_right_hand_side_of_table(table_config)
+        self._check_for_missed_column_on_left_hand_side_of_table(table_config)
         self._check_for_over_run_into_another_table(data, table_config.name)
         self._check_for_over_run_into_notes(data, table_config.name)
         if table_config.forward_fill_values:
@@ -425,39 +522,26 @@ class Parser:
             values should be between 0 and 100)
         """
         percentage_columns = []
-        sheet = self.openpyxl_file[table_config.sheet_name]
-        min_col, max_col = [
-            openpyxl.utils.column_index_from_string(col_alphabetical)
-            for col_alphabetical in table_config.column_range.split(":")
-        ]
-        if isinstance(table_config.header_rows, list):
-            min_row = table_config.header_rows[-1] + 1
-        else:
-            min_row = table_config.header_rows + 1
-        for col in sheet.iter_cols(
-            min_row=min_row,
-            max_row=table_config.end_row,
-            min_col=min_col,
-            max_col=max_col,
-        ):
+        sheet_percentage_cells = self._get_percentage_cells(table_config.sheet_name)
+        min_col, max_col = (
+            table_config.first_column_index,
+            table_config.last_column_index,
+        )
+        min_row = table_config.last_header_row + 1
+        for data_col_index, col in enumerate(range(min_col, max_col + 1)):
             percentage_cells = []
             skipped_rows = 0
-            for cell in col:
+            for row in range(min_row, table_config.end_row + 1):
                 if sr := table_config.skip_rows:
-                    if isinstance(sr, list) and cell.row in sr:
+                    if isinstance(sr, list) and row in sr:
                         skipped_rows += 1
                         continue
-                    elif isinstance(sr, int) and cell.row == sr:
+                    elif isinstance(sr, int) and row == sr:
                         skipped_rows += 1
                         continue
-                if isinstance(cell.value, (int, float)) and "%" in cell.number_format:
+                if (row, col) in sheet_percentage_cells:
                     percentage_cells.append(
-                        (
-                            cell.row - min_row - skipped_rows,
-                            _find_data_column_index(
-                                cell.column_letter, table_config.column_range
-                            ),
-                        )
+                        (row - min_row - skipped_rows, data_col_index)
                     )
 
             # add the data column index if the entire column consists of percentage values
@@ -530,7 +614,9 @@ class Parser:
         if config_checks:
             self._check_if_header_row_and_end_row_are_on_sheet(table_config)
             self._check_if_start_and_end_column_are_on_sheet(table_config)
-        data = read_table(self.file, table_config)
+        data = read_table(
+            self.file, table_config, self._get_sheet_data(table_config.sheet_name)
+        )
         self._check_columns_unique(data, table_config.name)
         data = _values_casting_and_sanitisation(data)
         data = self._postprocess_percentage_columns_between_0_and_100(
@@ -561,6 +647,14 @@ class Parser:
             config_checks: Specifies whether to check the tabe config by checking if the data
                 starts and ends where expected and the workbook header matches the config header.
         """
+        self._check_table_name(table_name)
+        table_config = self.table_configs[table_name]
+        data = self.get_table_from_config(table_config, config_checks=config_checks)
+        return data
+
+    def _check_table_name(self, table_name: str) -> None:
+        """Checks the table name is a string and that there is config for the table, suggesting the closest table
+        name if there isn't."""
         if not isinstance(table_name, str):
             raise ValueError("The parameter table_name must be provided as a string.")
         if table_name not in self.table_configs.keys():
@@ -570,15 +664,12 @@ class Parser:
                 + f" Did you mean '{closest}'?"
             )
 
-        table_config = self.table_configs[table_name]
-        data = self.get_table_from_config(table_config, config_checks=config_checks)
-        return data
-
     def save_tables(
         self,
         directory: str | Path,
         tables: list[str] | str = "all",
         config_checks: bool = True,
+        max_workers: int | None = None,
     ) -> None:
         """Saves tables from the provided workbook to the specified directory as CSV files.
 
@@ -594,17 +685,16 @@ class Parser:
             directory: Path to the directory or a pathlib Path object.
             config_checks: Specifies whether to check the tabe config by checking if the data
                 starts and ends where expected.
+            max_workers: If provided, a positive int. The tables are read and saved in parallel
+                by up to this many worker processes. Each worker loads the workbook itself, so
+                this is only faster when saving many tables on a machine with several cores.
+                Workers are sent this Parser's table configs, so configs modified in
+                `Parser.table_configs` are used. Tables on the same sheet are saved by the same
+                worker, so each sheet is only parsed once.
 
         Returns:
             None
         """
-        directory = self._make_path_object(directory)
-        if not directory.exists():
-            directory.mkdir(parents=True)
-
-        if not directory.is_dir():
-            raise ValueError("The path provided is not a directory.")
-
         if not (isinstance(tables, str) or isinstance(tables, list)):
             raise ValueError(
                 "The parameter tables must be provided as str or list[str]."
@@ -612,17 +702,84 @@ class Parser:
 
         if isinstance(tables, str) and tables != "all":
             raise ValueError(
-                "If the parameter tables is provided as a str it must \n",
-                f"have the value 'all' but '{tables}' was provided.",
+                "If the parameter tables is provided as a str it must "
+                + f"have the value 'all' but '{tables}' was provided."
             )
 
         if tables == "all":
             tables = self.table_configs.keys()
+        else:
+            # check all the table names before any tables are read and saved
+            for table_name in tables:
+                self._check_table_name(table_name)
+
+        if max_workers is not None and (
+            not isinstance(max_workers, int)
+            or isinstance(max_workers, bool)
+            or max_workers < 1
+        ):
+            raise ValueError(
+                "If the parameter max_workers is provided it must be a positive int "
+                + f"but {max_workers!r} was provided."
+            )
+
+        directory = self._make_path_object(directory)
+        if not directory.exists():
+            directory.mkdir(parents=True)
 
+        if not directory.is_dir():
+            raise ValueError("The path provided is not a directory.")
+
+        if max_workers is None:
+            for table_name in tables:
+                self._save_table(table_name, directory, config_checks)
+            return
+
+        tables_by_sheet = {}
         for table_name in tables:
-            table = self.get_table(table_name, config_checks=config_checks)
-            save_path = directory / Path(f"{table_name}.csv")
-            table.to_csv(save_path, index=False)
+            config = self.table_configs[table_name]
+            tables_by_sheet.setdefault(config.sheet_name, {})[table_name] = config
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _save_tables_in_worker,
+                    self.file_path,
+                    self.config_path,
+                    sheet_tables,
+                    directory,
+                    config_checks,
+                )
+                for sheet_tables in tables_by_sheet.values()
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+    def _save_table(
+        self, table_name: str, directory: Path, config_checks: bool
+    ) -> None:
+        """Reads a table and saves it to the directory as a CSV file named after the table."""
+        table = self.get_table(table_name, config_checks=config_checks)
+        save_path = directory / Path(f"{table_name}.csv")
+        table.to_csv(save_path, index=False)
+
+
+def _save_tables_in_worker(
+    file_path: Path,
+    config_path: Path,
+    table_configs: dict[str, TableConfig],
+    directory: Path,
+    config_checks: bool,
+) -> None:
+    """Saves tables from a worker process for `Parser.save_tables`.
+
+    The workbook is loaded in the worker, rather than sending the `Parser` and the workbook bytes to every worker.
+    The configs of the tables are sent from the parent `Parser`, so the tables are read with its configs rather than
+    the configs on disk.
+    """
+    workbook = Parser(file_path, config_path)
+    workbook.table_configs = table_configs
+    for table_name in table_configs:
+        workbook._save_table(table_name, directory, config_checks)
 
 
 class TableConfigError(Exception):
@@ -1,31 +1,44 @@
-from typing import List, Union
+from pathlib import Path
+from typing import List, Optional, Union
 
 import numpy as np
 import openpyxl
 import openpyxl.utils
 import pandas as pd
+from pandas.io.parsers import TextParser
 
 from isp_workbook_parser import TableConfig
 
 from .sanitisers import _column_name_sanitiser
 
 
-def read_table(workbook_file: pd.ExcelFile, table: TableConfig) -> pd.DataFrame:
+def read_table(
+    workbook_file: Union[str, Path, pd.ExcelFile, openpyxl.Workbook],
+    table: TableConfig,
+    sheet_data: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
     """Parses a table given a YAML config for the table
 
+    The cells of the sheet are parsed from the raw sheet data returned by
+    `read_sheet_data`. If `sheet_data` is not provided, the sheet is read from
+    `workbook_file` up to `table.end_row`. Passing in `sheet_data` allows many tables
+    on the same sheet to be parsed without re-reading the sheet from the workbook.
+    When reading several tables without `sheet_data`, passing an opened
+    `pd.ExcelFile` or `openpyxl.Workbook` as `workbook_file` avoids loading the
+    workbook for each table.
+
     If `table.header_rows` is an integer, the table is parsed directly.
 
-    If `table.header_rows` is a list of integers:
-        1. `table.header_rows` is checked to ensure that the list is composed of
-        consecutive and increasing integers
-        2. The table is parsed, with all columns read in as objects
-        3. The highest header (column of DataFrame) is forward filled
-        4. The intermediate headers (first rows of DataFrame), if they exist, are
+    If `table.header_rows` is a list of integers (which `TableConfig` checks is
+    composed of consecutive and increasing integers):
+        1. The table is parsed, with all columns read in as objects
+        2. The highest header (column of DataFrame) is forward filled
+        3. The intermediate headers (first rows of DataFrame), if they exist, are
         forward filled
-        5. The last header is added to the list of headers without forward filling.
+        4. The last header is added to the list of headers without forward filling.
         Any NaNs will mean the previous header names are applied
-        6. Headers are joined with '-' as a separator
-        7. New headers are applied, NAs in the DataFrame are forward filled and the
+        5. Headers are joined with '-' as a separator
+        6. New headers are applied, NAs in the DataFrame are forward filled and the
         header rows in the table are dropped
 
     Examples:
@@ -58,16 +71,21 @@ def read_table(workbook_file: pd.ExcelFile, table: TableConfig) -> pd.DataFrame:
     [5 rows x 27 columns]
 
     Args:
-        workbook_file: pandas ExcelFile object
+        workbook_file: path to the workbook, pandas ExcelFile object or openpyxl
+            Workbook. A Workbook should be loaded with `data_only=True`, so that the
+            values of formula cells are read rather than the formulas.
         table: Parsed table config
+        sheet_data: optional, raw sheet data for `table.sheet_name` as returned by
+            `read_sheet_data`
 
     Returns:
         Table as a pandas DataFrame
     """
+    if sheet_data is None:
+        sheet_data = read_sheet_data(workbook_file, table.sheet_name, table.end_row)
     if isinstance(table.header_rows, int):
-        df = pd.read_excel(
-            workbook_file,
-            sheet_name=table.sheet_name,
+        df = _parse_sheet_data(
+            sheet_data,
             header=(table.header_rows - 1),
             usecols=table.column_range,
             nrows=(table.end_row - table.header_rows),
@@ -81,9 +99,8 @@ def read_table(workbook_file: pd.ExcelFile, table: TableConfig) -> pd.DataFrame:
             )
         return df
     else:
-        df_initial = pd.read_excel(
-            workbook_file,
-            sheet_name=table.sheet_name,
+        df_initial = _parse_sheet_data(
+            sheet_data,
             header=(table.header_rows[0] - 1),
             usecols=table.column_range,
             nrows=(table.end_row - table.header_rows[0]),
@@ -91,43 +108,52 @@ def read_table(workbook_file: pd.ExcelFile, table: TableConfig) -> pd.DataFrame:
             dtype="object",
         )
         df_initial.columns = _column_name_sanitiser(df_initial.columns)
-        # check that header_rows list is sorted
-        assert sorted(table.header_rows) == table.header_rows
-        # check that the header_rows are adjacent
-        assert set(np.diff(table.header_rows)) == set([1])
         # start processing multiple header rows
         header_rows_in_table = table.header_rows[-1] - table.header_rows[0]
         initial_header = pd.Series(df_initial.columns)
         ffilled_initial_header = _ffill_highest_header(initial_header)
+        # the header rows in the table are taken out as an array once, rather than
+        # selecting each row from the DataFrame every time it is used
+        header_block = df_initial.iloc[:header_rows_in_table, :].to_numpy()
         filled_headers = []
         # ffill intermediate header rows
         for i in range(0, header_rows_in_table - 1):
             if i == 0:
                 preceding_header = initial_header
+            header_row = pd.Series(header_block[i])
             filled_headers.append(
-                _ffill_intermediate_header_row(df_initial.iloc[i, :], preceding_header)
+                _ffill_intermediate_header_row(header_row, preceding_header)
             )
-            preceding_header = df_initial.iloc[i, :]
+            preceding_header = header_row
         # process last header row
+        last_header_row = pd.Series(header_block[header_rows_in_table - 1])
         if not filled_headers:
             processed_last_header = _process_last_header_row(
-                df_initial.iloc[header_rows_in_table - 1, :], ffilled_initial_header
+                last_header_row, ffilled_initial_header
             )
         else:
             processed_last_header = _process_last_header_row(
-                df_initial.iloc[header_rows_in_table - 1, :], filled_headers[-1]
+                last_header_row, filled_headers[-1]
             )
         filled_headers.append(processed_last_header)
         # add separators manually - ignore any "" entries
+        separated_headers = []
         for series in filled_headers:
-            series[series != ""] = "_" + series[series != ""]
-        merged_headers = ffilled_initial_header.str.cat(filled_headers)
+            header = series.to_numpy(dtype="object")
+            separated_headers.append(np.where(header != "", "_" + header, header))
+        # join the names in each column of the header rows
+        merged_headers = pd.Index(
+            [
+                "".join(names)
+                for names in zip(ffilled_initial_header.to_numpy(), *separated_headers)
+            ]
+        )
         df_cleaned = _build_cleaned_dataframe(
             df_initial, header_rows_in_table, merged_headers, table.forward_fill_values
         )
         if table.skip_rows:
             df_cleaned = _skip_rows_in_dataframe(
-                df_cleaned, table.skip_rows, table.header_rows[-1]
+                df_cleaned, table.skip_rows, table.last_header_row
             )
         if table.columns_with_merged_rows:
             df_cleaned = _handle_merged_rows(
@@ -136,14 +162,91 @@ def read_table(workbook_file: pd.ExcelFile, table: TableConfig) -> pd.DataFrame:
         return df_cleaned
 
 
+def read_sheet_data(
+    workbook_file: Union[str, Path, pd.ExcelFile, openpyxl.Workbook],
+    sheet_name: str,
+    nrows: Optional[int] = None,
+) -> pd.DataFrame:
+    """Reads the raw cell values of a sheet without any parsing or type inference.
+
+    Empty cells are returned as empty strings, as they are by the pandas Excel readers
+    before the data is parsed into a DataFrame with `pandas.read_excel`.
+
+    Args:
+        workbook_file: path to the workbook, pandas ExcelFile object or openpyxl
+            Workbook (see `read_table`)
+        sheet_name: the sheet to read
+        nrows: optional, the number of rows to read from the top of the sheet. By
+            default, the whole sheet is read.
+
+    Returns:
+        Raw sheet data as a pandas DataFrame with a zero-indexed integer header and index
+    """
+    # pandas only recognises an opened openpyxl Workbook if the engine is specified
+    if isinstance(workbook_file, openpyxl.Workbook):
+        engine = "openpyxl"
+    else:
+        engine = None
+    return pd.read_excel(
+        workbook_file,
+        sheet_name=sheet_name,
+        header=None,
+        nrows=nrows,
+        dtype="object",
+        na_filter=False,
+        engine=engine,
+    )
+
+
+def _parse_sheet_data(
+    sheet_data: pd.DataFrame,
+    header: int,
+    usecols: str,
+    nrows: int,
+    dtype: Optional[str] = None,
+) -> pd.DataFrame:
+    """Parses a range of raw sheet data in the same way as `pandas.read_excel`.
+
+    Rows after the last row that is read are dropped, as are any trailing empty rows
+    (as the pandas Excel readers do). The remaining rows are passed to the pandas
+    `TextParser` used by `pandas.read_excel`.
+    """
+    rows = sheet_data.iloc[: header + 1 + nrows]
+    rows_with_data = np.flatnonzero((rows != "").any(axis=1).to_numpy())
+    if not rows_with_data.size:
+        return pd.DataFrame()
+    rows = rows.iloc[: rows_with_data[-1] + 1]
+    first_col, last_col = [
+        openpyxl.utils.column_index_from_string(col) for col in usecols.split(":")
+    ]
+    with TextParser(
+        rows.to_numpy().tolist(),
+        header=header,
+        usecols=list(range(first_col - 1, last_col)),
+        nrows=nrows,
+        dtype=dtype,
+        skip_blank_lines=False,
+    ) as parser:
+        return parser.read()
+
+
 def _ffill_highest_header(initial_header: pd.Series) -> pd.Series:
     """
     Forward fills the highest header row (parsed as DataFrame columns) for processing
     a multi-header table
     """
-    initial_header[initial_header.str.contains("Unnamed")] = pd.NA
-    ffill_initial_header = initial_header.ffill().reset_index(drop=True).fillna("")
-    return ffill_initial_header
+    header = initial_header.to_numpy(dtype="object")
+    # empty header cells are named "Unnamed: ..." by pandas
+    unnamed = np.array([name.startswith("Unnamed:") for name in header], dtype=bool)
+    # "Unnamed" columns are set to NA in place, as the preceding header of the first
+    # intermediate header row
+    initial_header[unnamed] = pd.NA
+    # each unnamed column takes the value of the nearest preceding named column, or ""
+    # if there isn't one
+    source_index = np.maximum.accumulate(np.where(unnamed, 0, np.arange(len(header))))
+    ffill_initial_header = header[source_index]
+    ffill_initial_header[unnamed[source_index]] = ""
+    return pd.Series(ffill_initial_header)
 
 
 def _ffill_intermediate_header_row(
@@ -160,18 +263,29 @@ def _ffill_intermediate_header_row(
     (e.g. "Name" in row 1 and "Name" in row 2), then make the nth element value
     NaN
 
-    N.B. "Unnamed" columns in pandas are actually NaNs
+    N.B. "Unnamed" columns in pandas are actually NaNs. The first element is never
+    changed.
     """
-    int_header = intermediate_header.copy(deep=True)
-    for n, value in zip(range(1, len(int_header)), int_header.iloc[1:]):
-        preceding_value = preceding_header.iloc[n]
-        if pd.isna(value):
-            if pd.isna(preceding_value):
-                int_header.iloc[n] = int_header.iloc[n - 1]
-        elif not pd.isna(preceding_value) and value == preceding_value:
-            int_header.iloc[n] = pd.NA
-
-    _ffill_intermediate_header = int_header.reset_index(drop=True).fillna("")
+    values = intermediate_header.to_numpy(dtype="object", copy=True)
+    preceding_values = preceding_header.to_numpy(dtype="object")
+    values_na = pd.isna(values)
+    preceding_na = pd.isna(preceding_values)
+    not_first = np.arange(len(values)) > 0
+    # 2. values equal to the preceding header's value are removed
+    both_present = ~values_na & ~preceding_na
+    duplicated = np.zeros(len(values), dtype=bool)
+    duplicated[both_present] = (
+        values[both_present] == preceding_values[both_present]
+    ).astype(bool)
+    values[duplicated & not_first] = np.nan
+    # 1. each value to fill takes the value before it, which may itself have been
+    # filled, so every value to fill takes the value of the nearest preceding element
+    # that isn't filled (even if that value is NaN)
+    to_fill = values_na & preceding_na & not_first
+    source_index = np.maximum.accumulate(np.where(to_fill, 0, np.arange(len(values))))
+    int_header = pd.Series(values[source_index])
+
+    _ffill_intermediate_header = int_header.fillna("")
     _ffill_intermediate_header = _column_name_sanitiser(_ffill_intermediate_header)
     return _ffill_intermediate_header
 
@@ -194,21 +308,20 @@ def _process_last_header_row(
 def _build_cleaned_dataframe(
     df_initial: pd.DataFrame,
     header_rows_in_table: int,
-    new_headers: pd.Series,
+    new_headers: pd.Index,
     forward_fill_values: bool,
 ) -> pd.DataFrame:
     """
     Builds a cleaned DataFrame with the merged headers by:
-    1. Dropping the header rows in the table
-    2. Applying the merged headers as the columns of the DataFrame
-    3. Forward fill values across columns if `forward_fill_values` is True
-    4. Reset the DataFrame index
+    1. Creating a DataFrame from the rows below the header rows in the table, with the
+       merged headers as its columns and a new index
+    2. Forward fill values across columns if `forward_fill_values` is True and there
+       are missing values to fill
     """
-    df_cleaned = df_initial.iloc[header_rows_in_table:, :]
-    df_cleaned.columns = new_headers
-    if forward_fill_values:
+    data = df_initial.to_numpy()[header_rows_in_table:]
+    df_cleaned = pd.DataFrame(data, columns=new_headers)
+    if forward_fill_values and pd.isna(data).any():
         df_cleaned = df_cleaned.ffill(axis=1)
-    df_cleaned = df_cleaned.reset_index(drop=True)
     return df_cleaned
 
 
@@ -217,15 +330,20 @@ def _skip_rows_in_dataframe(
 ) -> pd.DataFrame:
     """
     Drop rows specified by `skip_rows` by applying an offset from the header and
-    dropping based on index values
+    dropping the rows at those positions
     """
-    df_reset_index = df.reset_index(drop=True)
-    if isinstance(config_skip_rows, int):
-        skip_rows = [config_skip_rows - last_header_row - 1]
-    else:
-        skip_rows = np.subtract(config_skip_rows, last_header_row + 1)
-    dropped = df_reset_index.drop(index=skip_rows).reset_index(drop=True)
-    return dropped
+    skip_rows = np.subtract(np.atleast_1d(config_skip_rows), last_header_row + 1)
+    out_of_range = (skip_rows < 0) | (skip_rows >= len(df))
+    if out_of_range.any():
+        error_message = (
+            f"The skip_rows {np.atleast_1d(config_skip_rows)[out_of_range].tolist()} "
+            f"are not rows of the table data, which runs from row {last_header_row + 1} "
+            f"to row {last_header_row + len(df)}."
+        )
+        raise ValueError(error_message)
+    keep = np.ones(len(df), dtype=bool)
+    keep[skip_rows] = False
+    return df.iloc[keep].reset_index(drop=True)
 
 
 def _handle_merged_rows(
@@ -1,7 +1,31 @@
+import functools
+import re
+
 import pandas as pd
 
 from isp_workbook_parser.custom_string_replacements import typos_and_notes
 
+# Regular expressions used by the sanitisers are compiled once, as the sanitisers are
+# applied to the columns and header rows of every table
+_VERSIONING_PATTERN = re.compile(r"\.[\.\d]+$")
+_TYPOS_AND_NOTES_PATTERNS = [
+    (re.compile(known_bad_string), correction)
+    for known_bad_string, correction in typos_and_notes.items()
+]
+_COLUMN_NAME_FOOTNOTE_PATTERN = re.compile(r"(?<![A-Z]|\^|\s|\d)\d$")
+_NEWLINE_PATTERN = re.compile(r"\n")
+_DOUBLE_WHITESPACE_PATTERN = re.compile(r"\s\s")
+_TRAILING_ASTERISK_PATTERN = re.compile(r"\*$")
+_TRAILING_FOOTNOTE_PATTERN = re.compile(r"(?<=[^A-Z\s\d\.\_\-\#\^])\d$")
+_THOUSANDS_COMMA_PATTERN = re.compile(r"(?<=[0-9]),(?=[0-9]{1,3})")
+_NOTES_IN_PARENTHESES_PATTERN = re.compile(
+    r"^([0-9\.]+)\s(?:(\([\w\s\.\<\=\-]+\)?\s?)+)"
+)
+_NOTES_AFTER_HYPHEN_PATTERN = re.compile(
+    r"^(?![0-9]{4}\-[0-9]{2,4})([0-9\.]+)\s?(?:(\-[\w\s\.\<\=\-\(\)]+)+)"
+)
+_HYPHEN_AND_NOTES_PATTERN = re.compile(r"^\-\s?(?:(\([\w\s\.\<\=\-\(\)]+)+)")
+
 
 def _column_name_sanitiser(columns: pd.Index | pd.Series) -> pd.Index | pd.Series:
     """
@@ -13,33 +37,27 @@ def _column_name_sanitiser(columns: pd.Index | pd.Series) -> pd.Index | pd.Serie
     4. Removes duplicated whitespaces
     5. Removes trailing numbers that are footnotes
     """
-    columns = columns.astype(str)
-    columns = columns.str.replace(r"\.[\.\d]+$", "", regex=True)
-    columns = _custom_string_replacements(columns)
-    columns = columns.str.strip()
-    columns = _replace_series_newlines_with_whitespace(columns)
-    columns = _remove_series_double_whitespaces(columns)
-    columns = _remove_column_name_trailing_footnotes(columns)
-    return columns
-
-
-def _custom_string_replacements(
-    series: pd.Index | pd.Series,
-) -> pd.Index | pd.Series:
-    """If a known typo or unwanted note exits replace it with a known correction"""
-    for known_bad_string, correction in typos_and_notes.items():
-        series = series.str.replace(known_bad_string, correction, regex=True)
-    return series
-
-
-def _remove_column_name_trailing_footnotes(
-    series: pd.Index | pd.Series,
-) -> pd.Index | pd.Series:
-    """Removes footnotes by replacing a single trailing digit not preceded by
-    a hat (e.g. power to in loss equations), whitespace (e.g. name of a unit),
-    another digit (i.e. footnotes are assumed to be single digit) or
-    a capital letter preceded by an underscore (e.g. REZ names) with an empty string"""
-    return series.str.replace(r"(?<![A-Z]|\^|\s|\d)\d$", "", regex=True)
+    return columns.astype(str).map(_sanitise_column_name)
+
+
+@functools.lru_cache(maxsize=2048)
+def _sanitise_column_name(column_name: str) -> str:
+    """Applies the steps of `_column_name_sanitiser` to a single column name.
+
+    Applying all the steps to each name in a single pass over the names avoids
+    creating an intermediate `pandas.Index` or `pandas.Series` for every step. The
+    same names occur in the headers of many tables, so sanitised names are cached.
+    The cache is bounded, with room for the names in the headers of several
+    workbooks.
+    """
+    column_name = _VERSIONING_PATTERN.sub("", column_name)
+    for known_bad_string, correction in _TYPOS_AND_NOTES_PATTERNS:
+        column_name = known_bad_string.sub(correction, column_name)
+    column_name = column_name.strip()
+    column_name = _NEWLINE_PATTERN.sub(" ", column_name)
+    column_name = _DOUBLE_WHITESPACE_PATTERN.sub(" ", column_name)
+    column_name = _COLUMN_NAME_FOOTNOTE_PATTERN.sub("", column_name)
+    return column_name
 
 
 def _values_casting_and_sanitisation(df: pd.DataFrame) -> pd.DataFrame:
@@ -51,23 +69,23 @@ def _values_casting_and_sanitisation(df: pd.DataFrame) -> pd.DataFrame:
     will return `pd.NA`
     """
     df = _replace_dataframe_hyphens_with_na(df)
-    for object_col in df.dtypes[df.dtypes == "object"].keys():
+    for object_col in tuple(df.select_dtypes(include="object").columns):
         try:
             df.loc[:, object_col] = pd.to_numeric(df[object_col])
         except (ValueError, TypeError):
-            where_str_values = df[object_col].apply(lambda x: isinstance(x, str))
+            inferred_type = pd.api.types.infer_dtype(df[object_col], skipna=True)
+            if inferred_type == "string":
+                # every value that isn't NA is a string
+                where_str_values = df[object_col].notna()
+            elif inferred_type in ("mixed", "mixed-integer"):
+                where_str_values = df[object_col].apply(lambda x: isinstance(x, str))
+            else:
+                # there are no string values to sanitise, so casting will fail again
+                continue
             if not df.loc[where_str_values, object_col].empty:
-                for series_func in (
-                    _replace_series_newlines_with_whitespace,
-                    _remove_series_double_whitespaces,
-                    _custom_string_replacements,
-                    _strip_series_whitespaces,
-                    _remove_series_trailing_asterisks,
-                    _remove_series_thousands_commas,
-                    _remove_series_notes_after_values,
-                    _remove_series_trailing_footnotes,
-                ):
-                    df.loc[where_str_values, object_col] = series_func(df[object_col])
+                df.loc[where_str_values, object_col] = df.loc[
+                    where_str_values, object_col
+                ].map(_sanitise_string_value)
             # re-attempt conversion following sanitisation
             try:
                 df[object_col] = pd.to_numeric(df[object_col])
@@ -76,68 +94,18 @@ def _values_casting_and_sanitisation(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def _replace_dataframe_hyphens_with_na(df: pd.DataFrame) -> pd.DataFrame:
-    """Replaces any hyphen values with a `pandas.NA`"""
-    return df.replace("-", pd.NA, regex=False)
-
-
-def _replace_series_newlines_with_whitespace(
-    series: pd.Index | pd.Series,
-) -> pd.Index | pd.Series:
-    """Replaces newlines in a `pandas.Series` or `pandas.Index` with a whitespace"""
-    return series.str.replace(r"\n", " ", regex=True)
-
-
-def _remove_series_double_whitespaces(
-    series: pd.Index | pd.Series,
-) -> pd.Index | pd.Series:
-    """Removes any duplicated whitespaces in a `pandas.Series` or `pandas.Index`"""
-    return series.str.replace(r"\s\s", " ", regex=True)
-
-
-def _remove_series_trailing_asterisks(
-    series: pd.Index | pd.Series,
-) -> pd.Index | pd.Series:
-    """
-    Replaces trailing asterisks with an empty string in a `pandas.Series`
-    or `pandas.Index`
-    """
-    return series.str.replace(r"\*$", "", regex=True)
-
-
-def _remove_series_trailing_footnotes(
-    series: pd.Index | pd.Series,
-) -> pd.Index | pd.Series:
-    """Removes footnotes in a `pandas.Series` or `pandas.Index`
-
-    This is done by replacing a single trailing digit NOT preceded by a whitespace
-    (e.g. name of a unit), another digit (i.e. footnotes are assumed
-    to be single digit), a capital letter, underscore, hyphen or hash (e.g. DUID),
-    hat/caret (e.g. indicating 'to the power of' in constraints) or a decimal point
-    (e.g. Snowy 2.0) with an empty string
-    """
-    return series.str.replace(r"(?<=[^A-Z\s\d\.\_\-\#\^])\d$", "", regex=True)
-
-
-def _strip_series_whitespaces(series: pd.Index | pd.Series) -> pd.Index | pd.Series:
-    """Strips trailing and leading whitespaces in a `pandas.Series` or `pandas.Index`"""
-    return series.str.strip(" ")
-
+def _sanitise_string_value(value: str) -> str:
+    """Applies the string sanitisation steps of `_values_casting_and_sanitisation` to a
+    single string value.
 
-def _remove_series_thousands_commas(
-    series: pd.Index | pd.Series,
-) -> pd.Index | pd.Series:
-    """Removes thousands commas (i.e. commas preceded by and following digits)
-    in a `pandas.Series` or `pandas.Index`"""
-    return series.str.replace(r"(?<=[0-9]),(?=[0-9]{1,3})", "", regex=True)
-
-
-def _remove_series_notes_after_values(
-    series: pd.Index | pd.Series,
-) -> pd.Index | pd.Series:
-    """Removes notes after numeric values in a `pandas.Series` or `pandas.Index`
-
-    This is done using three regular expression substitutions:
+    The steps are applied in order:
+    1. Replace newlines with a whitespace
+    2. Remove duplicated whitespaces
+    3. Replace known typos and unwanted notes
+    4. Strip leading and trailing whitespaces
+    5. Remove trailing asterisks
+    6. Remove thousands commas (i.e. commas preceded by and following digits)
+    7. Remove notes after numeric values, using three regular expression substitutions:
         1. Capture a value (digits and decimal points) followed by one or more sequences
             of text preceded by an opening parenthesis. Retain the captured group.
         2. Capture a value (digits and decimal points) followed by one or more sequences
@@ -146,14 +114,29 @@ def _remove_series_notes_after_values(
             (e.g. 2024-25). Retain the captured group.
         3. Replace any hyphen followed by one or more sequences of text preceded by a
             hyphen with an empty string.
+    8. Remove trailing footnotes, i.e. a single trailing digit NOT preceded by a
+        whitespace (e.g. name of a unit), another digit (i.e. footnotes are assumed
+        to be single digit), a capital letter, underscore, hyphen or hash (e.g. DUID),
+        hat/caret (e.g. indicating 'to the power of' in constraints) or a decimal point
+        (e.g. Snowy 2.0)
+
+    Applying all the steps to each value in a single pass avoids creating a new
+    `pandas.Series` and writing it back to the DataFrame for every step.
     """
-    series = series.str.replace(
-        r"^([0-9\.]+)\s(?:(\([\w\s\.\<\=\-]+\)?\s?)+)", r"\1", regex=True
-    )
-    series = series.str.replace(
-        r"^(?![0-9]{4}\-[0-9]{2,4})([0-9\.]+)\s?(?:(\-[\w\s\.\<\=\-\(\)]+)+)",
-        r"\1",
-        regex=True,
-    )
-    series = series.str.replace(r"^\-\s?(?:(\([\w\s\.\<\=\-\(\)]+)+)", "", regex=True)
-    return series
+    value = _NEWLINE_PATTERN.sub(" ", value)
+    value = _DOUBLE_WHITESPACE_PATTERN.sub(" ", value)
+    for known_bad_string, correction in _TYPOS_AND_NOTES_PATTERNS:
+        value = known_bad_string.sub(correction, value)
+    value = value.strip(" ")
+    value = _TRAILING_ASTERISK_PATTERN.sub("", value)
+    value = _THOUSANDS_COMMA_PATTERN.sub("", value)
+    value = _NOTES_IN_PARENTHESES_PATTERN.sub(r"\1", value)
+    value = _NOTES_AFTER_HYPHEN_PATTERN.sub(r"\1", value)
+    value = _HYPHEN_AND_NOTES_PATTERN.sub("", value)
+    value = _TRAILING_FOOTNOTE_PATTERN.sub("", value)
+    return value
+
+
+def _replace_dataframe_hyphens_with_na(df: pd.DataFrame) -> pd.DataFrame:
+    """Replaces any hyphen values with a `pandas.NA`"""
+    return df.replace("-", pd.NA, regex=False)
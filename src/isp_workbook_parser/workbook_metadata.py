@@ -0,0 +1,169 @@
+"""Reads workbook metadata directly from the XML parts of an xlsx file.
+
+Loading a workbook with `openpyxl` (which `pandas` also does) parses the workbook's styles, which takes several
+seconds for the IASR workbooks. The sheet names and the small number of cell values needed when a `Parser` is created
+are read from the XML parts of the file instead, so that the workbook is only loaded once a table is read.
+"""
+
+import posixpath
+import re
+import zipfile
+from typing import Any
+from xml.etree import ElementTree
+
+from openpyxl.utils import column_index_from_string
+
+_MAIN_NAMESPACE = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_RELATIONSHIP_ID = (
+    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+)
+_PACKAGE_RELATIONSHIP = (
+    "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+)
+_RELATIONSHIP_TYPES = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+)
+_CELL_REFERENCE = re.compile(r"([A-Z]+)(\d+)")
+
+
+def read_sheet_names(archive: zipfile.ZipFile) -> list[str]:
+    """Returns the names of the sheets in the workbook, in the order they appear in the workbook."""
+    return list(_get_sheet_paths(archive))
+
+
+def read_column_values(
+    archive: zipfile.ZipFile, sheet_name: str, column: str
+) -> list[Any]:
+    """Returns the values of the non-empty cells in a column of a sheet, in row order.
+
+    Cells are matched to the column by their cell reference. Cell references are optional, so a cell without one is
+    taken to be in the column after the previous cell in its row.
+
+    The sheet's XML is streamed, so only the sheet itself is parsed. Values are the values saved in the workbook
+    (i.e. the cached values of formula cells). Numbers are returned as `int` or `float`, booleans as `bool` and all
+    other values as `str`. Number formats aren't applied, so dates are returned as their serial numbers.
+
+    Args:
+        archive: The xlsx file opened as a `zipfile.ZipFile`.
+        sheet_name: The name of the sheet.
+        column: The column letter(s), e.g. 'B'.
+    """
+    sheet_paths = _get_sheet_paths(archive)
+    if sheet_name not in sheet_paths:
+        raise KeyError(f"Worksheet {sheet_name} does not exist.")
+    column_index = column_index_from_string(column)
+    shared_strings = None
+    values = []
+    with archive.open(sheet_paths[sheet_name]) as sheet:
+        cell_column_index = 0
+        for _, element in ElementTree.iterparse(sheet):
+            if element.tag == f"{_MAIN_NAMESPACE}row":
+                # cells are only needed until the end of their row is parsed
+                element.clear()
+                cell_column_index = 0
+                continue
+            if element.tag != f"{_MAIN_NAMESPACE}c":
+                continue
+            reference = _CELL_REFERENCE.fullmatch(element.get("r", ""))
+            if reference is None:
+                cell_column_index += 1
+            else:
+                cell_column_index = column_index_from_string(reference.group(1))
+            if cell_column_index != column_index:
+                continue
+            cell_type = element.get("t", "n")
+            if cell_type == "inlineStr":
+                text = "".join(
+                    text_element.text or ""
+                    for text_element in element.iter(f"{_MAIN_NAMESPACE}t")
+                )
+                values.append(text)
+                continue
+            value = element.find(f"{_MAIN_NAMESPACE}v")
+            if value is None or value.text is None:
+                continue
+            if cell_type == "s":
+                if shared_strings is None:
+                    shared_strings = _read_shared_strings(archive)
+                values.append(shared_strings[int(value.text)])
+            elif cell_type == "n":
+                values.append(_to_number(value.text))
+            elif cell_type == "b":
+                values.append(value.text == "1")
+            else:
+                values.append(value.text)
+    return values
+
+
+def _to_number(text: str) -> int | float:
+    """Converts the text of a numeric cell to an int, if it is a whole number without an exponent, or a float."""
+    if "." in text or "E" in text or "e" in text:
+        return float(text)
+    return int(text)
+
+
+def _get_sheet_paths(archive: zipfile.ZipFile) -> dict[str, str]:
+    """Returns the paths of the worksheet parts in the archive, keyed by sheet name."""
+    workbook_path = _get_relationship_targets(archive, "", "officeDocument")[0]
+    relationships = _read_relationships(archive, workbook_path)
+    workbook = ElementTree.fromstring(archive.read(workbook_path))
+    return {
+        sheet.get("name"): relationships[sheet.get(_RELATIONSHIP_ID)][1]
+        for sheet in workbook.iter(f"{_MAIN_NAMESPACE}sheet")
+    }
+
+
+def _read_shared_strings(archive: zipfile.ZipFile) -> list[str]:
+    """Returns the workbook's shared strings table.
+
+    Rich text strings are made up of several runs, which are joined. Phonetic runs are ignored.
+    """
+    workbook_path = _get_relationship_targets(archive, "", "officeDocument")[0]
+    shared_strings_paths = _get_relationship_targets(
+        archive, workbook_path, "sharedStrings"
+    )
+    if not shared_strings_paths:
+        return []
+    shared_strings = ElementTree.fromstring(archive.read(shared_strings_paths[0]))
+    strings = []
+    for string_item in shared_strings.iter(f"{_MAIN_NAMESPACE}si"):
+        text_elements = string_item.findall(f"{_MAIN_NAMESPACE}t") + [
+            text_element
+            for run in string_item.findall(f"{_MAIN_NAMESPACE}r")
+            for text_element in run.findall(f"{_MAIN_NAMESPACE}t")
+        ]
+        strings.append("".join(element.text or "" for element in text_elements))
+    return strings
+
+
+def _get_relationship_targets(
+    archive: zipfile.ZipFile, part_path: str, relationship_type: str
+) -> list[str]:
+    """Returns the paths of the parts that a part has a relationship of the given type with."""
+    return [
+        target
+        for target_type, target in _read_relationships(archive, part_path).values()
+        if target_type == _RELATIONSHIP_TYPES + relationship_type
+    ]
+
+
+def _read_relationships(
+    archive: zipfile.ZipFile, part_path: str
+) -> dict[str, tuple[str, str]]:
+    """Returns the relationships of a part as a dict mapping relationship ids to (type, target path).
+
+    The package's own relationships are read when the part path is an empty string. Target paths are resolved
+    relative to the part's directory, unless they are absolute.
+    """
+    directory, file_name = posixpath.split(part_path)
+    relationships_path = posixpath.join(directory, "_rels", f"{file_name}.rels")
+    relationships = ElementTree.fromstring(archive.read(relationships_path))
+    resolved = {}
+    for relationship in relationships.iter(_PACKAGE_RELATIONSHIP):
+        target = relationship.get("Target")
+        if target.startswith("/"):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join(directory, target))
+        resolved[relationship.get("Id")] = (relationship.get("Type"), target)
+    return resolved
@@ -1,3 +1,4 @@
+from collections import Counter
 from pathlib import Path
 
 import pytest
@@ -5,47 +6,58 @@ import pytest
 from isp_workbook_parser import Parser
 
 workbook_path = Path("workbooks")
+workbook_files = sorted(workbook_path.glob("*/[!.]*.xls*"))
 
 
-@pytest.mark.parametrize("workbook_version_folder", workbook_path.iterdir())
-def test_packaged_table_configs_for_each_version(workbook_version_folder: Path):
-    xl_file = [file for file in workbook_version_folder.glob("[!.]*.xls*")]
-    assert (
-        len(xl_file) == 1
-    ), f"There should only be one Excel workbook in each version sub-directory, got {xl_file}"
-    workbook_name = xl_file.pop()
-    workbook = Parser(workbook_name)
+def _packaged_tables():
+    """Returns a test case for each packaged table config of each workbook version."""
+    return [
+        pytest.param(
+            workbook_name, table_name, id=f"{workbook_name.parent.name}-{table_name}"
+        )
+        for workbook_name in workbook_files
+        for table_name in Parser(workbook_name).table_configs
+    ]
+
+
+@pytest.fixture(scope="module")
+def workbooks() -> dict[Path, Parser]:
+    return {workbook_name: Parser(workbook_name) for workbook_name in workbook_files}
+
 
+def test_one_workbook_in_each_version_folder():
+    workbooks_per_folder = Counter(file.parent for file in workbook_files)
+    for workbook_version_folder in workbook_path.iterdir():
+        assert (
+            workbooks_per_folder[workbook_version_folder] == 1
+        ), f"There should only be one Excel workbook in each version sub-directory, got {workbooks_per_folder[workbook_version_folder]} in {workbook_version_folder}"
+
+
+@pytest.mark.parametrize(
+    "workbook_name", workbook_files, ids=lambda file: file.parent.name
+)
+def test_packaged_table_configs_for_each_version(workbook_name: Path, workbooks):
     # Check that configs don't look at the same tables.
-    configs = workbook.table_configs
-    sheet_and_header_combos = [
-        c.sheet_name + str(c.header_rows) + c.column_range for c in configs.values()
-    ]
-    table_names = [c.name for c in configs.values()]
+    configs = workbooks[workbook_name].table_configs
+    seen_combos = {}
     duplicate_configs = []
-    for index, value in enumerate(sheet_and_header_combos):
-        if sheet_and_header_combos.count(value) > 1:
-            duplicate_configs.append(table_names[index])
-    if len(duplicate_configs) > 0:
-        print(duplicate_configs)
-    assert len(duplicate_configs) == 0
-
+    for c in configs.values():
+        combo = (
+            c.sheet_name,
+            tuple(c.header_rows) if isinstance(c.header_rows, list) else c.header_rows,
+            c.column_range,
+        )
+        if combo in seen_combos:
+            duplicate_configs.append((seen_combos[combo], c.name))
+        else:
+            seen_combos[combo] = c.name
+    assert not duplicate_configs, duplicate_configs
+
+
+@pytest.mark.parametrize("workbook_name, table_name", _packaged_tables())
+def test_packaged_table(workbook_name: Path, table_name: str, workbooks):
+    workbook = workbooks[workbook_name]
+    table = workbook.get_table(table_name)
     save_dir = Path(f"example_output/{workbook.workbook_version}")
     save_dir.mkdir(parents=True, exist_ok=True)
-    error_tables = {}
-    for table_name in workbook.table_configs:
-        try:
-            table = workbook.get_table(table_name)
-            save_path = save_dir / Path(f"{table_name}.csv")
-            table.to_csv(save_path, index=False)
-        except Exception as e:
-            error_tables[table_name] = e
-    if error_tables:
-        error_str = ""
-        for key in error_tables:
-            error_str += str(error_tables[key]) + "\n"
-        raise TableLoadError(error_str)
-
-
-class TableLoadError(Exception):
-    """Exception to throw if table loading fails"""
+    table.to_csv(save_dir / Path(f"{table_name}.csv"), index=False)
@@ -0,0 +1,52 @@
+import copy
+import os
+import pickle
+import shutil
+
+import pandas as pd
+
+from isp_workbook_parser import Parser
+
+workbook_path = "workbooks/6.0/2024-isp-inputs-and-assumptions-workbook.xlsx"
+
+
+def test_parser_picks_up_edited_config(workbook_v6, tmp_path):
+    config_file = tmp_path / "financial_parameters.yaml"
+    shutil.copy(workbook_v6.config_path / "financial_parameters.yaml", config_file)
+    workbook = Parser(workbook_path, user_config_directory_path=tmp_path)
+    assert workbook.table_configs["discount_rate"].end_row == 9
+    config_file.write_text(
+        config_file.read_text().replace("end_row: 9", "end_row: 10", 1)
+    )
+    modified_time = config_file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(config_file, ns=(modified_time, modified_time))
+    edited_workbook = Parser(workbook_path, user_config_directory_path=tmp_path)
+    assert edited_workbook is not workbook
+    assert edited_workbook.table_configs["discount_rate"].end_row == 10
+    assert workbook.table_configs["discount_rate"].end_row == 9
+
+
+def test_parsers_for_same_workbook_are_independent(workbook_v6):
+    workbook = Parser(workbook_path)
+    assert workbook is not workbook_v6
+    workbook.table_configs.pop("discount_rate")
+    assert "discount_rate" in workbook_v6.table_configs
+
+
+def test_parser_copy_round_trip(workbook_v6):
+    workbook = copy.copy(workbook_v6)
+    assert workbook is not workbook_v6
+    assert workbook.workbook_version == workbook_v6.workbook_version
+    pd.testing.assert_frame_equal(
+        workbook.get_table("discount_rate"), workbook_v6.get_table("discount_rate")
+    )
+
+
+def test_parser_pickle_round_trip(workbook_v6):
+    workbook_v6.get_table("discount_rate")
+    workbook = pickle.loads(pickle.dumps(workbook_v6))
+    assert workbook.workbook_version == workbook_v6.workbook_version
+    assert workbook.table_configs.keys() == workbook_v6.table_configs.keys()
+    pd.testing.assert_frame_equal(
+        workbook.get_table("discount_rate"), workbook_v6.get_table("discount_rate")
+    )
@@ -1,4 +1,11 @@
+import re
+
+import openpyxl
+import pandas as pd
+import pytest
+
 from isp_workbook_parser.config_model import TableConfig
+from isp_workbook_parser.read_table import read_table
 
 
 def test_skip_single_row_in_single_header_row_table(workbook_v6):
@@ -11,8 +18,8 @@ def test_skip_single_row_in_single_header_row_table(workbook_v6):
         skip_rows=30,
     )
     df = workbook_v6.get_table_from_config(table_config)
-    assert len(df) == (table_config.end_row - table_config.header_rows - 1)
-    assert df[df.Technology.str.contains("Hydrogen")].empty
+    assert len(df) == (table_config.end_row - table_config.last_header_row - 1)
+    assert not df["Technology"].str.contains("Hydrogen", regex=False, na=False).any()
 
 
 def test_skip_multiple_rows_in_single_header_row_table(workbook_v6):
@@ -25,9 +32,11 @@ def test_skip_multiple_rows_in_single_header_row_table(workbook_v6):
         skip_rows=[8, 9, 19],
     )
     df = workbook_v6.get_table_from_config(table_config)
-    assert len(df) == (table_config.end_row - table_config.header_rows - 3)
-    assert df[df["Generator type"].str.contains("Hydrogen")].empty
-    assert df[df["Generator type"].str.contains("Coal")].empty
+    assert len(df) == (table_config.end_row - table_config.last_header_row - 3)
+    assert (
+        not df["Generator type"].str.contains("Hydrogen", regex=False, na=False).any()
+    )
+    assert not df["Generator type"].str.contains("Coal", regex=False, na=False).any()
 
 
 def test_skip_multiple_rows_in_multiple_header_row_table(workbook_v6):
@@ -41,8 +50,23 @@ def test_skip_multiple_rows_in_multiple_header_row_table(workbook_v6):
         skip_rows=(list(range(29, 35)) + [48]),
     )
     df = workbook_v6.get_table_from_config(table_config)
-    assert len(df) == (table_config.end_row - table_config.header_rows[-1] - 7)
-    assert df[df["Wind High_REZ ID"].str.contains("V")].empty
+    assert len(df) == (table_config.end_row - table_config.last_header_row - 7)
+    assert not df["Wind High_REZ ID"].str.contains("V", regex=False, na=False).any()
+
+
+@pytest.mark.parametrize("skip_rows", [31, [7, 8], [9, 31]])
+def test_skip_rows_outside_table_throws_error(workbook_v6, skip_rows):
+    table_config = TableConfig(
+        name="existing_generator_maintenance_rates",
+        sheet_name="Maintenance",
+        header_rows=7,
+        end_row=19,
+        column_range="B:D",
+        skip_rows=skip_rows,
+    )
+    error_message = "are not rows of the table data, which runs from row 8 to row 19."
+    with pytest.raises(ValueError, match=re.escape(error_message)):
+        workbook_v6.get_table_from_config(table_config)
 
 
 def test_no_forward_fill_in_rows(workbook_v6):
@@ -55,10 +79,19 @@ def test_no_forward_fill_in_rows(workbook_v6):
         forward_fill_values=False,
     )
     df = workbook_v6.get_table_from_config(table_config)
-    assert all(df.iloc[:, -1].isna())
-    assert all(
-        df.loc[
-            df["Fuel type"] == "Large scale Solar PV",
-            [col for col in df.columns if col != "Fuel type"],
-        ]
+    assert df.iloc[:, -1].isna().all()
+    assert (
+        df.loc[df["Fuel type"] == "Large scale Solar PV", df.columns != "Fuel type"]
+        .isna()
+        .all(axis=None)
+    )
+
+
+def test_read_table_from_opened_openpyxl_workbook(workbook_v6):
+    table_config = workbook_v6.table_configs["wind_high_capacity_factors"]
+    workbook = openpyxl.load_workbook(
+        workbook_v6.file_path, read_only=True, data_only=True, keep_links=False
     )
+    from_workbook = read_table(workbook, table_config)
+    from_excel_file = read_table(workbook_v6.file, table_config)
+    pd.testing.assert_frame_equal(from_workbook, from_excel_file)
@@ -1,15 +1,11 @@
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
 from isp_workbook_parser.sanitisers import (
-    _remove_series_double_whitespaces,
-    _remove_series_notes_after_values,
-    _remove_series_thousands_commas,
-    _remove_series_trailing_asterisks,
-    _remove_series_trailing_footnotes,
-    _replace_series_newlines_with_whitespace,
-    _strip_series_whitespaces,
+    _sanitise_column_name,
+    _sanitise_string_value,
     _values_casting_and_sanitisation,
 )
 
@@ -27,143 +23,17 @@ def test_sanitisation_on_flow_path_transfer_capability():
     pd.testing.assert_frame_equal(test_sanitised, expected, check_dtype=False)
 
 
-def test_replace_series_newlines_with_whitespace(sample_series):
-    result = _replace_series_newlines_with_whitespace(sample_series)
+def test_sanitise_string_value(sample_series):
+    result = sample_series.map(_sanitise_string_value)
     expected = pd.Series(
         [
             "First line Second line",
-            "This  is  a  test",
-            "Value with *",
-            "SomeUnitA5",
-            "An actual footnote1",
-            "  leading and trailing  ",
-            "1,234,567",
-            "50.0 - note",
-            "35.5 (comment)",
-            "42.0 - note (additional info)",
-            "999.9 (info) - second note",
-            "2024-25 data for year",
-        ]
-    )
-    pd.testing.assert_series_equal(result, expected)
-
-
-def test_remove_series_double_whitespaces(sample_series):
-    result = _remove_series_double_whitespaces(sample_series)
-    expected = pd.Series(
-        [
-            "First line\nSecond line",
             "This is a test",
-            "Value with *",
-            "SomeUnitA5",
-            "An actual footnote1",
-            " leading and trailing ",
-            "1,234,567",
-            "50.0 - note",
-            "35.5 (comment)",
-            "42.0 - note (additional info)",
-            "999.9 (info) - second note",
-            "2024-25 data for year",
-        ]
-    )
-    pd.testing.assert_series_equal(result, expected)
-
-
-def test_remove_series_trailing_asterisks(sample_series):
-    result = _remove_series_trailing_asterisks(sample_series)
-    expected = pd.Series(
-        [
-            "First line\nSecond line",
-            "This  is  a  test",
             "Value with ",
             "SomeUnitA5",
-            "An actual footnote1",
-            "  leading and trailing  ",
-            "1,234,567",
-            "50.0 - note",
-            "35.5 (comment)",
-            "42.0 - note (additional info)",
-            "999.9 (info) - second note",
-            "2024-25 data for year",
-        ]
-    )
-    pd.testing.assert_series_equal(result, expected)
-
-
-def test_remove_series_trailing_footnotes(sample_series):
-    result = _remove_series_trailing_footnotes(sample_series)
-    expected = pd.Series(
-        [
-            "First line\nSecond line",
-            "This  is  a  test",
-            "Value with *",
-            "SomeUnitA5",
             "An actual footnote",
-            "  leading and trailing  ",
-            "1,234,567",
-            "50.0 - note",
-            "35.5 (comment)",
-            "42.0 - note (additional info)",
-            "999.9 (info) - second note",
-            "2024-25 data for year",
-        ]
-    )
-    pd.testing.assert_series_equal(result, expected)
-
-
-def test_strip_series_whitespaces(sample_series):
-    result = _strip_series_whitespaces(sample_series)
-    expected = pd.Series(
-        [
-            "First line\nSecond line",
-            "This  is  a  test",
-            "Value with *",
-            "SomeUnitA5",
-            "An actual footnote1",
             "leading and trailing",
-            "1,234,567",
-            "50.0 - note",
-            "35.5 (comment)",
-            "42.0 - note (additional info)",
-            "999.9 (info) - second note",
-            "2024-25 data for year",
-        ]
-    )
-    pd.testing.assert_series_equal(result, expected)
-
-
-def test_remove_series_thousands_commas(sample_series):
-    result = _remove_series_thousands_commas(sample_series)
-    expected = pd.Series(
-        [
-            "First line\nSecond line",
-            "This  is  a  test",
-            "Value with *",
-            "SomeUnitA5",
-            "An actual footnote1",
-            "  leading and trailing  ",
             "1234567",
-            "50.0 - note",
-            "35.5 (comment)",
-            "42.0 - note (additional info)",
-            "999.9 (info) - second note",
-            "2024-25 data for year",
-        ]
-    )
-    pd.testing.assert_series_equal(result, expected)
-
-
-def test_remove_series_notes_after_values(sample_series):
-    result = _remove_series_notes_after_values(sample_series)
-    expected = pd.Series(
-        [
-            "First line\nSecond line",
-            "This  is  a  test",
-            "Value with *",
-            "SomeUnitA5",
-            "An actual footnote1",
-            "  leading and trailing  ",
-            "1,234,567",
             "50.0",
             "35.5",
             "42.0",
@@ -172,3 +42,38 @@ def test_remove_series_notes_after_values(sample_series):
         ]
     )
     pd.testing.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("First line\nSecond line", "First line Second line"),
+        ("This  is  a  test", "This is a test"),
+        ("Value with *", "Value with "),
+        ("1,234,567", "1234567"),
+        ("50.0-note", "50.0"),
+        ("- (comment)", ""),
+        ("Snowy 2.0", "Snowy 2.0"),
+        ("DUID_1", "DUID_1"),
+        ("x^2", "x^2"),
+    ],
+)
+def test_sanitise_string_value_steps(value, expected):
+    assert _sanitise_string_value(value) == expected
+
+
+@pytest.mark.parametrize(
+    "column_name, expected",
+    [
+        ("Generator.1", "Generator"),
+        ("  leading and trailing  ", "leading and trailing"),
+        ("Capacity\n(MW)", "Capacity (MW)"),
+        ("This  is  a  test", "This is a test"),
+        ("An actual footnote1", "An actual footnote"),
+        ("SomeUnitA5", "SomeUnitA5"),
+        ("Value with *", "Value with *"),
+        ("35.5 (comment)", "35.5 (comment)"),
+    ],
+)
+def test_sanitise_column_name(column_name, expected):
+    assert _sanitise_column_name(column_name) == expected
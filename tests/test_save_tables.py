@@ -0,0 +1,76 @@
+import pandas as pd
+import pytest
+
+from isp_workbook_parser import Parser
+
+
+def test_invalid_tables_type_throws_error_before_creating_directory(
+    workbook_v6, tmp_path
+):
+    directory = tmp_path / "output"
+    with pytest.raises(
+        ValueError, match="The parameter tables must be provided as str or list"
+    ):
+        workbook_v6.save_tables(directory, tables=("discount_rate",))
+    assert not directory.exists()
+
+
+def test_invalid_tables_str_throws_error_before_creating_directory(
+    workbook_v6, tmp_path
+):
+    directory = tmp_path / "output"
+    error_message = (
+        "If the parameter tables is provided as a str it must have the value 'all' "
+        + "but 'discount_rate' was provided."
+    )
+    with pytest.raises(ValueError, match=error_message):
+        workbook_v6.save_tables(directory, tables="discount_rate")
+    assert not directory.exists()
+
+
+def test_save_tables_writes_csv(workbook_v6, tmp_path):
+    workbook_v6.save_tables(tmp_path, tables=["discount_rate"])
+    assert (tmp_path / "discount_rate.csv").exists()
+
+
+def test_save_tables_with_workers_matches_serial_save(workbook_v6, tmp_path):
+    tables = ["discount_rate", "wind_high_capacity_factors"]
+    workbook_v6.save_tables(tmp_path / "serial", tables=tables)
+    workbook_v6.save_tables(tmp_path / "parallel", tables=tables, max_workers=2)
+    for table_name in tables:
+        serial = (tmp_path / "serial" / f"{table_name}.csv").read_text()
+        parallel = (tmp_path / "parallel" / f"{table_name}.csv").read_text()
+        assert parallel == serial
+
+
+def test_unknown_table_name_throws_error_before_saving_tables(workbook_v6, tmp_path):
+    directory = tmp_path / "output"
+    with pytest.raises(ValueError, match="Did you mean 'discount_rate'"):
+        workbook_v6.save_tables(directory, tables=["discount_rate", "discount_rat"])
+    assert not directory.exists()
+
+
+@pytest.mark.parametrize("max_workers", [0, -1, 1.5, True])
+def test_invalid_max_workers_throws_error_before_creating_directory(
+    workbook_v6, tmp_path, max_workers
+):
+    directory = tmp_path / "output"
+    with pytest.raises(
+        ValueError, match="max_workers is provided it must be a positive int"
+    ):
+        workbook_v6.save_tables(
+            directory, tables=["discount_rate"], max_workers=max_workers
+        )
+    assert not directory.exists()
+
+
+def test_save_tables_with_workers_uses_modified_config(tmp_path):
+    workbook = Parser("workbooks/6.0/2024-isp-inputs-and-assumptions-workbook.xlsx")
+    config = workbook.table_configs["discount_rate"]
+    workbook.table_configs["discount_rate"] = config.model_copy(
+        update={"skip_rows": config.end_row}
+    )
+    workbook.save_tables(tmp_path, tables=["discount_rate"], max_workers=1)
+    saved = pd.read_csv(tmp_path / "discount_rate.csv")
+    assert len(saved) == len(workbook.get_table("discount_rate"))
+    assert len(saved) == config.end_row - config.last_header_row - 1
@@ -1,175 +1,180 @@
+import re
+
+import openpyxl
 import pytest
 
+from isp_workbook_parser import Parser
 from isp_workbook_parser.config_model import TableConfig
 from isp_workbook_parser.parser import TableConfigError
 
 
-def test_end_row_not_on_sheet_throws_error(workbook_v6):
-    table_config = TableConfig(
-        name="DUMMY",
-        sheet_name="Aggregated energy storages",
-        header_rows=95,
-        end_row=200,
-        column_range="B:AF",
-    )
-    error_message = (
-        f"The end_row for table {table_config.name} is not within the excel sheet."
-    )
-    with pytest.raises(TableConfigError, match=error_message):
-        workbook_v6.get_table_from_config(table_config)
-
-
-def test_first_header_row_not_on_sheet_throws_error(workbook_v6):
-    table_config = TableConfig(
-        name="DUMMY",
-        sheet_name="Aggregated energy storages",
-        header_rows=200,
-        end_row=95,
-        column_range="B:AF",
-    )
-    error_message = f"The first header row for table {table_config.name} is not within the excel sheet."
-    with pytest.raises(TableConfigError, match=error_message):
-        workbook_v6.get_table_from_config(table_config)
-
-
-def test_first_column_not_on_sheet_throws_error(workbook_v6):
-    table_config = TableConfig(
-        name="DUMMY",
-        sheet_name="Aggregated energy storages",
-        header_rows=10,
-        end_row=23,
-        column_range="AI:AF",
-    )
-    error_message = (
-        f"The first column for table {table_config.name} is not within the excel sheet."
-    )
-    with pytest.raises(TableConfigError, match=error_message):
-        workbook_v6.get_table_from_config(table_config)
-
-
-def test_last_column_not_on_sheet_throws_error(workbook_v6):
+@pytest.mark.parametrize(
+    "sheet_name, header_rows, end_row, column_range, error_message",
+    [
+        pytest.param(
+            "Aggregated energy storages",
+            95,
+            200,
+            "B:AF",
+            "The end_row for table DUMMY is not within the excel sheet.",
+            id="end_row_not_on_sheet",
+        ),
+        pytest.param(
+            "Aggregated energy storages",
+            200,
+            95,
+            "B:AF",
+            "The first header row for table DUMMY is not within the excel sheet.",
+            id="first_header_row_not_on_sheet",
+        ),
+        pytest.param(
+            "Aggregated energy storages",
+            10,
+            23,
+            "AI:AF",
+            "The first column for table DUMMY is not within the excel sheet.",
+            id="first_column_not_on_sheet",
+        ),
+        pytest.param(
+            "Aggregated energy storages",
+            10,
+            23,
+            "B:AI",
+            "The last column for table DUMMY is not within the excel sheet.",
+            id="last_column_not_on_sheet",
+        ),
+        pytest.param(
+            "Aggregated energy storages",
+            10,
+            23,
+            "B:AF",
+            "The first column of the table DUMMY contains na values indicating the "
+            "table end row is incorrectly specified.",
+            id="end_row_runs_into_another_table",
+        ),
+        pytest.param(
+            "Network Capability",
+            [6, 7],
+            22,
+            "B:J",
+            "The first column of the table DUMMY contains the sub string 'Notes:'.",
+            id="end_row_runs_into_notes",
+        ),
+        pytest.param(
+            "Generator Reliability Settings",
+            [20, 21],
+            28,
+            "B:G",
+            "There is data or a header above the first header row for table DUMMY.",
+            id="first_header_row_too_late",
+        ),
+        pytest.param(
+            "Network Capability",
+            [6, 7],
+            20,
+            "B:J",
+            "There is data in the row after the defined table end for table DUMMY.",
+            id="end_row_too_soon",
+        ),
+        pytest.param(
+            "Network Capability",
+            [6, 7],
+            21,
+            "B:I",
+            "There is data in the column adjacent to the last column in the table "
+            "DUMMY.",
+            id="end_column_too_soon",
+        ),
+        pytest.param(
+            "Network Capability",
+            [6, 7],
+            21,
+            "C:J",
+            "There is data in the column adjacent to the first column in the table "
+            "DUMMY.",
+            id="start_column_too_far",
+        ),
+        pytest.param(
+            "Network Capability",
+            [7, 8],
+            20,
+            "B:J",
+            "There are duplicate column names in the table DUMMY.",
+            id="duplicate_column_names",
+        ),
+    ],
+)
+def test_bad_config_throws_error(
+    workbook_v6, sheet_name, header_rows, end_row, column_range, error_message
+):
     table_config = TableConfig(
         name="DUMMY",
-        sheet_name="Aggregated energy storages",
-        header_rows=10,
-        end_row=23,
-        column_range="B:AI",
+        sheet_name=sheet_name,
+        header_rows=header_rows,
+        end_row=end_row,
+        column_range=column_range,
     )
-    error_message = (
-        f"The last column for table {table_config.name} is not within the excel sheet."
-    )
-    with pytest.raises(TableConfigError, match=error_message):
+    with pytest.raises(TableConfigError, match=re.escape(error_message)):
         workbook_v6.get_table_from_config(table_config)
 
 
-def test_end_row_runs_into_another_table_throws_error(workbook_v6):
-    table_config = TableConfig(
-        name="DUMMY",
-        sheet_name="Aggregated energy storages",
-        header_rows=10,
-        end_row=23,
-        column_range="B:AF",
-    )
-    error_message = (
-        "The first column of the table DUMMY contains na values indicating the table end row is "
-        "incorrectly specified."
-    )
-    with pytest.raises(TableConfigError, match=error_message):
-        workbook_v6.get_table_from_config(table_config)
-
-
-def test_end_row_runs_into_notes_throws_error(workbook_v6):
-    table_config = TableConfig(
-        name="DUMMY",
-        sheet_name="Network Capability",
-        header_rows=[6, 7],
-        end_row=22,
-        column_range="B:J",
-    )
-    error_message = (
-        "The first column of the table DUMMY contains the sub string 'Notes:'."
-    )
-    with pytest.raises(TableConfigError, match=error_message):
-        workbook_v6.get_table_from_config(table_config)
-
-
-def test_first_header_row_too_late_throws_error(workbook_v6):
-    table_config = TableConfig(
-        name="DUMMY",
-        sheet_name="Generator Reliability Settings",
-        header_rows=[20, 21],
-        end_row=28,
-        column_range="B:G",
-    )
-    error_message = f"There is data or a header above the first header row for table {table_config.name}."
-    with pytest.raises(TableConfigError, match=error_message):
-        workbook_v6.get_table_from_config(table_config)
-
-
-def test_end_row_too_soon_throws_error(workbook_v6):
-    table_config = TableConfig(
-        name="DUMMY",
-        sheet_name="Network Capability",
-        header_rows=[6, 7],
-        end_row=20,
-        column_range="B:J",
-    )
-    error_message = (
-        "There is data in the row after the defined table end for table DUMMY."
-    )
-    with pytest.raises(TableConfigError, match=error_message):
-        workbook_v6.get_table_from_config(table_config)
-
-
-def test_end_column_too_soon_throws_error(workbook_v6):
-    table_config = TableConfig(
-        name="DUMMY",
-        sheet_name="Network Capability",
-        header_rows=[6, 7],
-        end_row=21,
-        column_range="B:I",
-    )
-    error_message = (
-        "There is data in the column adjacent to the last column in the table DUMMY."
-    )
-    with pytest.raises(TableConfigError, match=error_message):
-        workbook_v6.get_table_from_config(table_config)
-
-
-def test_start_column_too_far_throws_error(workbook_v6):
+def test_good_config_throws_no_error(workbook_v6):
     table_config = TableConfig(
         name="DUMMY",
         sheet_name="Network Capability",
         header_rows=[6, 7],
         end_row=21,
-        column_range="C:J",
-    )
-    error_message = (
-        "There is data in the column adjacent to the first column in the table DUMMY."
-    )
-    with pytest.raises(TableConfigError, match=error_message):
-        workbook_v6.get_table_from_config(table_config)
-
-
-def test_duplicate_column_names_throws_error(workbook_v6):
-    table_config = TableConfig(
-        name="DUMMY",
-        sheet_name="Network Capability",
-        header_rows=[7, 8],
-        end_row=20,
         column_range="B:J",
     )
-    error_message = "There are duplicate column names in the table DUMMY."
-    with pytest.raises(TableConfigError, match=error_message):
-        workbook_v6.get_table_from_config(table_config)
+    workbook_v6.get_table_from_config(table_config)
 
 
-def test_good_config_throws_no_error(workbook_v6):
+@pytest.mark.parametrize("header_rows", [[7, 9], [8, 7], [7]])
+def test_header_rows_not_consecutive_throws_error(header_rows):
+    with pytest.raises(ValueError, match="header_rows must be an int or a list"):
+        TableConfig(
+            name="DUMMY",
+            sheet_name="Network Capability",
+            header_rows=header_rows,
+            end_row=21,
+            column_range="B:J",
+        )
+
+
+@pytest.fixture
+def workbook_with_na_strings_next_to_table(tmp_path, request) -> Parser:
+    workbook = openpyxl.Workbook()
+    workbook.active.title = "Change Log"
+    workbook["Change Log"]["B1"] = 6.0
+    sheet = workbook.create_sheet("Data")
+    sheet["C2"], sheet["D2"] = "Region", "Value"
+    for row in range(3, 6):
+        sheet[f"B{row}"] = request.param
+        sheet[f"C{row}"] = f"Region {row}"
+        sheet[f"D{row}"] = row
+        sheet[f"E{row}"] = request.param
+    file_path = tmp_path / "workbook.xlsx"
+    workbook.save(file_path)
+    config_path = tmp_path / "config"
+    config_path.mkdir()
+    return Parser(file_path, user_config_directory_path=config_path)
+
+
+@pytest.mark.parametrize(
+    "workbook_with_na_strings_next_to_table",
+    ["N/A", "#N/A", "NA", "null"],
+    indirect=True,
+)
+def test_na_strings_in_adjacent_columns_throw_no_error(
+    workbook_with_na_strings_next_to_table,
+):
     table_config = TableConfig(
         name="DUMMY",
-        sheet_name="Network Capability",
-        header_rows=[6, 7],
-        end_row=21,
-        column_range="B:J",
-    )
-    workbook_v6.get_table_from_config(table_config)
+        sheet_name="Data",
+        header_rows=2,
+        end_row=5,
+        column_range="C:D",
+    )
+    data = workbook_with_na_strings_next_to_table.get_table_from_config(table_config)
+    assert list(data.columns) == ["Region", "Value"]
+    assert len(data) == 3
@@ -0,0 +1,69 @@
+import re
+import zipfile
+
+import openpyxl
+import pytest
+
+from isp_workbook_parser import Parser
+from isp_workbook_parser.workbook_metadata import read_column_values, read_sheet_names
+
+
+def test_sheet_names_match_pandas(workbook_v6):
+    with zipfile.ZipFile(workbook_v6.file_path) as archive:
+        sheet_names = read_sheet_names(archive)
+    assert sheet_names == workbook_v6.file.sheet_names
+
+
+def test_column_values_match_openpyxl(workbook_v6):
+    with zipfile.ZipFile(workbook_v6.file_path) as archive:
+        values = read_column_values(archive, "Change Log", "B")
+    expected = [
+        value
+        for (value,) in workbook_v6.openpyxl_file["Change Log"].iter_rows(
+            min_col=2, max_col=2, values_only=True
+        )
+        if value is not None
+    ]
+    assert values == expected
+    assert workbook_v6.workbook_version == "6.0"
+
+
+def _save_workbook_with_change_log(file_path, rows):
+    workbook = openpyxl.Workbook()
+    workbook.active.title = "Change Log"
+    for row in rows:
+        workbook["Change Log"].append(row)
+    workbook.save(file_path)
+
+
+def test_column_values_of_cells_without_references(tmp_path):
+    file_path = tmp_path / "workbook.xlsx"
+    _save_workbook_with_change_log(
+        file_path, [["Version", "Notes"], [None, 5.0, "First"], ["A", 6.0, "Second"]]
+    )
+    # cell references are optional, so remove them from the cells of the last row
+    without_references = tmp_path / "without_references.xlsx"
+    with zipfile.ZipFile(file_path) as source:
+        with zipfile.ZipFile(without_references, "w") as target:
+            for item in source.infolist():
+                data = source.read(item)
+                if item.filename == "xl/worksheets/sheet1.xml":
+                    data = re.sub(rb'(<c) r="[A-Z]+3"', rb"\1", data)
+                    assert b'r="B3"' not in data
+                target.writestr(item, data)
+    with zipfile.ZipFile(without_references) as archive:
+        assert read_column_values(archive, "Change Log", "B") == ["Notes", 5, 6]
+        assert read_column_values(archive, "Change Log", "C") == ["First", "Second"]
+
+
+def test_missing_sheet_throws_error(workbook_v6):
+    with zipfile.ZipFile(workbook_v6.file_path) as archive:
+        with pytest.raises(KeyError, match="Worksheet Missing does not exist."):
+            read_column_values(archive, "Missing", "B")
+
+
+def test_empty_version_column_throws_error(tmp_path):
+    file_path = tmp_path / "workbook.xlsx"
+    _save_workbook_with_change_log(file_path, [["Change Log"]])
+    with pytest.raises(ValueError, match="The workbook version could not be read"):
+        Parser(file_path, user_config_directory_path=tmp_path)